@@ -1,11 +1,20 @@
-from flask import Flask, render_template, request, redirect, url_for, session, flash, jsonify, get_flashed_messages
+from flask import Flask, render_template, request, redirect, url_for, session, flash, jsonify, get_flashed_messages, Response, g
 from itsdangerous import URLSafeSerializer, BadSignature
-import os, smtplib, threading
+import os, smtplib, threading, csv, io, uuid, logging
+import click
 import time # <-- NEW: Imported for token expiration
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-from database import db # <-- import the singleton db
-from models import User, Booking, Venue
+from database import db, add_missing_columns # <-- import the singleton db
+from models import User, Booking, Venue, VenueDailyUsage, booking_pending_created_index, booking_pending_notified_index, booking_date_index, booking_venue_date_index
+from archive import archive_cutoff, archive_bookings, booking_history
+from rollups import refresh_usage, rebuild_usage, usage_report
+from expiry import sweep_pending, start_sweeper
+from auth_sessions import PrincipalCache, create_session, load_principal, end_session, revoke_user_sessions
+from assets import MANIFEST_NAME, build_manifest, load_manifest, prune_dist, is_fingerprinted
+from compression import compress_response
+from singleflight import SingleFlight
+from structured_logging import setup_logging, get_logger
 
 app = Flask(__name__)
 # It is highly recommended to use a strong, long, random key here, not a simple string
@@ -16,7 +25,7 @@ instance_path = os.path.join(os.path.abspath(os.path.dirname(__file__)), "instan
 os.makedirs(instance_path, exist_ok=True)
 
 # DB config
-app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{os.path.join(instance_path, 'venue_booking.db')}"
+app.config["SQLALCHEMY_DATABASE_URI"] = os.environ.get("DATABASE_URL", f"sqlite:///{os.path.join(instance_path, 'venue_booking.db')}")
 app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
 
 # Initialize db with the app
@@ -33,6 +42,36 @@ app.config.setdefault("BASE_URL", os.environ.get("BASE_URL", "http://127.0.0.1:5
 app.config.setdefault("IMAP_SERVER", os.environ.get("IMAP_SERVER", "imap.gmail.com"))
 app.config.setdefault("IMAP_PORT", int(os.environ.get("IMAP_PORT", 993)))
 
+# Archival: bookings older than ARCHIVE_AFTER_DAYS move to booking_archive in batches
+app.config.setdefault("ARCHIVE_AFTER_DAYS", int(os.environ.get("ARCHIVE_AFTER_DAYS", 90)))
+app.config.setdefault("ARCHIVE_BATCH_SIZE", int(os.environ.get("ARCHIVE_BATCH_SIZE", 500)))
+
+# Server-side sessions: lifetime of a login and how long each worker caches a user principal
+app.config.setdefault("SESSION_LIFETIME_HOURS", float(os.environ.get("SESSION_LIFETIME_HOURS", 12)))
+app.config.setdefault("PRINCIPAL_CACHE_TTL", int(os.environ.get("PRINCIPAL_CACHE_TTL", 60)))
+app.config.setdefault("AUTH_GENERATION_FILE", os.environ.get("AUTH_GENERATION_FILE", os.path.join(instance_path, "auth_generation")))
+principal_cache = PrincipalCache(app.config["AUTH_GENERATION_FILE"], ttl=app.config["PRINCIPAL_CACHE_TTL"])
+
+# Response compression (HTML/JSON/CSV) and long-lived caching of fingerprinted static assets
+app.config.setdefault("COMPRESS_MIN_SIZE", int(os.environ.get("COMPRESS_MIN_SIZE", 1024)))
+app.config.setdefault("COMPRESS_LEVEL", int(os.environ.get("COMPRESS_LEVEL", 6)))
+app.config.setdefault("ASSET_MAX_AGE", int(os.environ.get("ASSET_MAX_AGE", 31536000)))  # 1 year
+asset_manifest = load_manifest(app.static_folder)
+
+# Logging: JSON lines via a background queue listener; high-frequency debug events are sampled
+app.config.setdefault("LOG_LEVEL", os.environ.get("LOG_LEVEL", "INFO"))
+app.config.setdefault("LOG_SAMPLE_RATE", float(os.environ.get("LOG_SAMPLE_RATE", 0.01)))
+setup_logging(app.config["LOG_LEVEL"])
+log = get_logger()
+
+# Pending sweeper: re-send admin links, then expire bookings nobody decided on (0 disables a step)
+app.config.setdefault("PENDING_RENOTIFY_AFTER_HOURS", float(os.environ.get("PENDING_RENOTIFY_AFTER_HOURS", 24)))
+app.config.setdefault("PENDING_EXPIRE_AFTER_HOURS", float(os.environ.get("PENDING_EXPIRE_AFTER_HOURS", 72)))
+app.config.setdefault("PENDING_SWEEP_BATCH_SIZE", int(os.environ.get("PENDING_SWEEP_BATCH_SIZE", 200)))
+app.config.setdefault("PENDING_SWEEP_INTERVAL", int(os.environ.get("PENDING_SWEEP_INTERVAL", 300)))
+# Run the sweeper inside each web worker (one is elected leader); otherwise use `flask sweep-pending` from cron
+app.config.setdefault("PENDING_SWEEPER_ENABLED", os.environ.get("PENDING_SWEEPER_ENABLED", "False") in [True, "True", "true", "1"])
+
 # --------------------------------------------------------------------------------------
 # SECURITY: Token Generation and Verification
 # --------------------------------------------------------------------------------------
@@ -62,7 +101,8 @@ def verify_decision_token(token: str):
 
 def send_email(subject: str, html_body: str, to_email: str) -> bool:
     if not app.config["MAIL_SERVER"] or not app.config["MAIL_USERNAME"] or not app.config["MAIL_PASSWORD"]:
-        print("[EMAIL] Missing SMTP config; printing email instead:\nSUBJECT:", subject, "\nTO:", to_email, "\nBODY:\n", html_body)
+        log.warning("Missing SMTP config; email not sent", extra={"subject": subject, "to": to_email})
+        log.debug("Unsent email body", extra={"subject": subject, "body": html_body})
         return False
     msg = MIMEMultipart("alternative")
     msg["Subject"] = subject
@@ -77,7 +117,7 @@ def send_email(subject: str, html_body: str, to_email: str) -> bool:
             server.sendmail(msg["From"], [msg["To"]], msg.as_string())
         return True
     except Exception as e:
-        print("[EMAIL] Send failed:", e)
+        log.error("Email send failed", extra={"subject": subject, "to": to_email, "error": str(e)})
         return False
 
 def send_booking_email_to_admin(booking: Booking):
@@ -129,11 +169,46 @@ def send_booking_email_to_admin(booking: Booking):
     """
     send_email(subject, html, app.config["ADMIN_EMAIL"])
 
+# Availability lookups: concurrent requests for the same (venue, date) share one query
+slot_lookups = SingleFlight()
+
+def venue_day_bookings(venue: str, date: str):
+    """Returns the bookings of one venue/day as plain dicts (safe to share across threads)."""
+    def load():
+        return [
+            {
+                'id': b.id,
+                'slot': b.slot,
+                'event_name': b.event_name,
+                'faculty_name': b.faculty_name,
+                'num_people': b.num_people,
+                'canteen_details': b.canteen_details,
+                'status': b.status
+            }
+            for b in Booking.query.filter_by(venue=venue, date=date).all()
+        ]
+    return slot_lookups.do((venue, date), load)
+
+def venue_day_changed(venue: str, date: str):
+    """Call after committing a booking change so later lookups don't join an older query."""
+    slot_lookups.forget((venue, date))
+
 # Initialize DB and create default admin
 # Initialize DB and create default users
 with app.app_context():
     db.create_all()
     
+    # Columns/indexes added after the booking table was first created
+    if add_missing_columns("booking", {"created_at": "INTEGER", "notified_at": "INTEGER"}):
+        now = int(time.time())
+        db.session.execute(db.update(Booking).where(Booking.created_at.is_(None)).values(created_at=now, notified_at=now))
+        db.session.commit()
+        log.info("Added booking timestamp columns")
+    booking_pending_created_index.create(db.engine, checkfirst=True)
+    booking_pending_notified_index.create(db.engine, checkfirst=True)
+    booking_date_index.create(db.engine, checkfirst=True)
+    booking_venue_date_index.create(db.engine, checkfirst=True)
+    
     # Seed default venues if none exist
     if Venue.query.count() == 0:
         default_venues = [
@@ -143,23 +218,77 @@ with app.app_context():
             Venue(name="Lab 2", capacity=40, location="CS Dept"),
         ]
         db.session.add_all(default_venues)
-        print("Seeded default venues")
+        log.info("Seeded default venues")
 
     # Default admin
     if not User.query.filter_by(username="admin").first():
         admin = User(username="admin", password="admin123", role="admin")
         db.session.add(admin)
-        print("Default admin created: username=admin / password=admin123")
+        log.info("Default admin created: username=admin / password=admin123")
     
     # Dummy faculty
     if not User.query.filter_by(username="faculty").first():
         faculty = User(username="faculty", password="faculty123", role="faculty")
         db.session.add(faculty)
-        print("Dummy faculty created: username=faculty / password=faculty123")
+        log.info("Dummy faculty created: username=faculty / password=faculty123")
     
     # Commit all changes
     db.session.commit()
 
+    # Backfill utilization rollups for databases created before they existed
+    if VenueDailyUsage.query.count() == 0 and Booking.query.count() > 0:
+        log.info("Backfilled venue usage rollups", extra={"rollups": rebuild_usage()})
+
+if app.config["PENDING_SWEEPER_ENABLED"]:
+    start_sweeper(app, notify=send_booking_email_to_admin)
+
+# Correlate log lines of one request; honours an upstream X-Request-ID
+@app.before_request
+def assign_request_id():
+    g.request_id = request.headers.get("X-Request-ID") or uuid.uuid4().hex
+
+# Resolve the logged-in user from the server-side session store on every request.
+# Routes keep reading session["user"], but it is now derived from `sid`, so a
+# deleted account or reset password takes effect immediately.
+@app.before_request
+def load_session_user():
+    sid = session.get("sid")
+    principal = load_principal(sid, principal_cache) if sid else None
+    if principal is None:
+        if "user" in session or "sid" in session:
+            session.pop("user", None)
+            session.pop("sid", None)
+    elif session.get("user") != principal:
+        session["user"] = principal
+
+@app.after_request
+def finalize_response(response):
+    if "request_id" in g:
+        response.headers["X-Request-ID"] = g.request_id
+    if (request.endpoint == "static" and response.status_code == 200
+            and is_fingerprinted(request.view_args.get("filename", ""))):
+        # Hashed file names change with their content, so they can be cached forever
+        # (only real hits: a 404 for a hashed name must not be cached)
+        response.cache_control.no_cache = None
+        response.cache_control.public = True
+        response.cache_control.max_age = app.config["ASSET_MAX_AGE"]
+        response.cache_control.immutable = True
+        return response
+    return compress_response(response, request.headers.get("Accept-Encoding", ""),
+                             app.config["COMPRESS_MIN_SIZE"], app.config["COMPRESS_LEVEL"])
+
+# Templates reference static files through asset_url() so they pick up the hashed
+# name from static/manifest.json; without a build they fall back to the plain file.
+@app.context_processor
+def inject_asset_url():
+    def asset_url(filename: str) -> str:
+        return url_for("static", filename=asset_manifest.get(filename, filename))
+    return {"asset_url": asset_url}
+
+def login_user(user: User):
+    session["sid"] = create_session(user, int(app.config["SESSION_LIFETIME_HOURS"] * 3600))
+    session["user"] = {"id": user.id, "username": user.username, "role": user.role}
+
 # Home page
 @app.route("/")
 def home():
@@ -187,7 +316,7 @@ def login_admin():
         
         user = User.query.filter_by(username=username, password=password, role="admin").first()
         if user:
-            session["user"] = {"id": user.id, "username": user.username, "role": user.role}
+            login_user(user)
             flash("Admin login successful", "success")
             return redirect(url_for("admin_dashboard"))
         else:
@@ -209,7 +338,7 @@ def login_faculty():
         
         user = User.query.filter_by(username=username, password=password, role="faculty").first()
         if user:
-            session["user"] = {"id": user.id, "username": user.username, "role": user.role}
+            login_user(user)
             flash("Faculty login successful", "success")
             return redirect(url_for("faculty_dashboard"))
         else:
@@ -281,27 +410,11 @@ def admin_slot_details():
         if not venue or not date:
             return jsonify({"booked": [], "pending": []})
         
-        bookings = Booking.query.filter_by(venue=venue, date=date).all()
+        bookings = venue_day_bookings(venue, date)
         
         # Separate approved and pending bookings with full details
-        booked_bookings = []
-        pending_bookings = []
-        
-        for booking in bookings:
-            booking_data = {
-                'id': booking.id,
-                'slot': booking.slot,
-                'event_name': booking.event_name,
-                'faculty_name': booking.faculty_name,
-                'num_people': booking.num_people,
-                'canteen_details': booking.canteen_details,
-                'status': booking.status
-            }
-            
-            if booking.status == "Approved":
-                booked_bookings.append(booking_data)
-            elif booking.status == "Pending":
-                pending_bookings.append(booking_data)
+        booked_bookings = [b for b in bookings if b['status'] == "Approved"]
+        pending_bookings = [b for b in bookings if b['status'] == "Pending"]
         
         return jsonify({
             "booked": booked_bookings,
@@ -328,24 +441,26 @@ def booked_slots():
     if not venue or not date:
         return jsonify({"booked": [], "pending": []})
     
-    # 1. Fetch ALL relevant bookings
-    bookings = Booking.query.filter_by(venue=venue, date=date).all()
+    # 1. Fetch ALL relevant bookings (shared with concurrent identical lookups)
+    bookings = venue_day_bookings(venue, date)
     
     # 2. Separate approved and pending slots
     
     # Check for APPROVED status
     booked_slots = [
-        b.slot for b in bookings 
-        if b.status.lower() == "approved"
+        b['slot'] for b in bookings 
+        if b['status'].lower() == "approved"
     ]
     
     # Check for PENDING status
     pending_slots = [
-        b.slot for b in bookings 
-        if b.status == "Pending"
+        b['slot'] for b in bookings 
+        if b['status'] == "Pending"
     ]
     
-    print(f"DEBUG: Booked Slots: {booked_slots}, Pending Slots: {pending_slots}")
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("Booked slots lookup", extra={"venue": venue, "date": date, "booked": booked_slots,
+                                                "pending": pending_slots, "sample_rate": app.config["LOG_SAMPLE_RATE"]})
     
     return jsonify({
         "booked": booked_slots,
@@ -404,7 +519,9 @@ def faculty_book():
             booking_list.append(booking)
 
         try:
+            refresh_usage([(venue, date)])
             db.session.commit() # Commit all bookings
+            venue_day_changed(venue, date)
         except Exception as e:
             db.session.rollback()
             flash(f"Error saving booking: {e}", "danger")
@@ -487,19 +604,22 @@ def email_booking_decision(token):
                 related_booking.status = new_status
                 updated_slots.append(related_booking.slot)
             
+        refresh_usage([(booking.venue, booking.date)])
         db.session.commit() # SECURITY: Commit all changes atomically
+        venue_day_changed(booking.venue, booking.date)
         
         slots_text = ", ".join(updated_slots)
         if not updated_slots:
              flash(f"Booking(s) for event {booking.event_name} were already processed by another admin.", "info")
              return redirect(url_for("home"))
 
+        log.info("Booking decision via email", extra={"booking_id": booking_id, "status": new_status, "slots": updated_slots})
         flash(f"Booking(s) for '{booking.event_name}' on {booking.date} for slots {slots_text} have been **{new_status.upper()}** via email link.", "success")
         return redirect(url_for("home"))
 
     except Exception as e:
         db.session.rollback() # SECURITY: Rollback on error
-        print(f"Error processing email decision for booking {booking_id}: {e}")
+        log.exception("Error processing email decision", extra={"booking_id": booking_id})
         flash("An unexpected error occurred during the decision process. Please try again.", "danger")
         return redirect(url_for("home"))
 
@@ -523,7 +643,9 @@ def faculty_cancel_booking(booking_id):
         # Only allow cancellation of Approved or Pending bookings
         if booking.status == "Approved" or booking.status == "Pending":
             db.session.delete(booking)
+            refresh_usage([(booking.venue, booking.date)])
             db.session.commit()
+            venue_day_changed(booking.venue, booking.date)
             flash("Booking cancelled", "info")
         else:
              flash(f"Cannot cancel a booking that is already {booking.status}.", "warning")
@@ -554,21 +676,28 @@ def admin_approve(booking_id):
                 status="Pending"
             ).all()
 
+            if not related_bookings:
+                flash(f"Booking #{booking_id} is already {booking.status} and cannot be approved.", "info")
+                return redirect(url_for("admin_dashboard"))
+
             # Approve all related bookings
             updated_slots = []
             for related_booking in related_bookings:
                 related_booking.status = "Approved"
                 updated_slots.append(related_booking.slot)
 
+            refresh_usage([(booking.venue, booking.date)])
             db.session.commit()
+            venue_day_changed(booking.venue, booking.date)
 
             slots_text = ", ".join(updated_slots)
+            log.info("Booking approved", extra={"booking_id": booking_id, "slots": updated_slots})
             flash(f"Booking approved for slots: {slots_text}", "success")
             return redirect(url_for("admin_dashboard"))
 
         except Exception as e:
             db.session.rollback()
-            print(f"Error approving booking {booking_id}: {e}")
+            log.exception("Error approving booking", extra={"booking_id": booking_id})
             flash("An error occurred during approval.", "danger")
             return redirect(url_for("admin_dashboard"))
 
@@ -590,21 +719,28 @@ def admin_reject(booking_id):
                 status="Pending"
             ).all()
 
+            if not related_bookings:
+                flash(f"Booking #{booking_id} is already {booking.status} and cannot be rejected.", "info")
+                return redirect(url_for("admin_dashboard"))
+
             # Reject all related bookings
             updated_slots = []
             for related_booking in related_bookings:
                 related_booking.status = "Rejected"
                 updated_slots.append(related_booking.slot)
 
+            refresh_usage([(booking.venue, booking.date)])
             db.session.commit()
+            venue_day_changed(booking.venue, booking.date)
 
             slots_text = ", ".join(updated_slots)
+            log.info("Booking rejected", extra={"booking_id": booking_id, "slots": updated_slots})
             flash(f"Booking rejected for slots: {slots_text}", "info")
             return redirect(url_for("admin_dashboard"))
 
         except Exception as e:
             db.session.rollback()
-            print(f"Error rejecting booking {booking_id}: {e}")
+            log.exception("Error rejecting booking", extra={"booking_id": booking_id})
             flash("An error occurred during rejection.", "danger")
             return redirect(url_for("admin_dashboard"))
 
@@ -612,24 +748,59 @@ def admin_reject(booking_id):
     return redirect(url_for("login"))
 
 
-# Admin: Clear all booking history
-@app.route("/admin/clear_history", methods=["POST"]) # Kept POST for mass destructive action, requires form CSRF token
+# Admin: Clear booking history (archives past bookings instead of deleting them)
+@app.route("/admin/clear_history", methods=["POST"]) # Kept POST for mass action, requires form CSRF token
 def admin_clear_history():
     if session.get("user") and session["user"]["role"] == "admin":
         try:
-            # Delete all bookings
-            Booking.query.delete()
-            db.session.commit()
-            flash("All booking history cleared", "info")
+            # Move every booking dated before today out of the live table
+            moved = archive_bookings(archive_cutoff(0), app.config["ARCHIVE_BATCH_SIZE"])
+            flash(f"Archived {moved} past booking(s)", "info")
             return redirect(url_for("admin_dashboard"))
         except Exception as e:
-            db.session.rollback()
-            flash(f"Error clearing history: {e}", "danger")
+            flash(f"Error archiving history: {e}", "danger")
             return redirect(url_for("admin_dashboard"))
             
     flash("Access denied", "danger")
     return redirect(url_for("login"))
 
+# Admin: Export bookings (live + archived) as CSV
+@app.route("/admin/export")
+def admin_export():
+    if session.get("user") and session["user"]["role"] == "admin":
+        include_archived = request.args.get("archived", "1") not in ["0", "false", "False"]
+        rows = booking_history(include_archived=include_archived)
+        
+        out = io.StringIO()
+        writer = csv.writer(out)
+        writer.writerow(["id", "event_name", "faculty_name", "num_people", "venue", "slot", "date",
+                         "status", "canteen_details", "other_requirements", "archived"])
+        for row in rows:
+            writer.writerow(list(row))
+        return Response(out.getvalue(), mimetype="text/csv",
+                        headers={"Content-Disposition": "attachment; filename=bookings.csv"})
+    flash("Access denied", "danger")
+    return redirect(url_for("login"))
+
+# Admin: Venue utilization analytics (reads only the rollup table)
+@app.route("/admin/analytics")
+def admin_analytics():
+    if session.get("user") and session["user"]["role"] == "admin":
+        venues = [v.name for v in Venue.query.order_by(Venue.name.asc()).all()]
+        return render_template("admin_analytics.html", title="Venue Analytics", venues=venues)
+    flash("Access denied", "danger")
+    return redirect(url_for("login"))
+
+@app.route("/admin/analytics.json")
+def admin_analytics_data():
+    if session.get("user") and session["user"]["role"] == "admin":
+        return jsonify(usage_report(
+            venue=request.args.get("venue") or None,
+            start=request.args.get("start") or None,
+            end=request.args.get("end") or None,
+        ))
+    return jsonify({"error": "Access denied"}), 403
+
 # Admin: Venues management
 @app.route("/admin/venues")
 def admin_venues():
@@ -736,8 +907,10 @@ def admin_delete_faculty(user_id):
             return redirect(url_for("admin_faculty"))
             
         try:
+            revoke_user_sessions(user.id)
             db.session.delete(user)
             db.session.commit()
+            principal_cache.invalidate()
             flash("Faculty deleted", "info")
         except Exception as e:
             db.session.rollback()
@@ -764,7 +937,9 @@ def admin_reset_faculty_password(user_id):
             
         try:
             user.password = new_password
+            revoke_user_sessions(user.id)
             db.session.commit()
+            principal_cache.invalidate()
             flash("Password reset", "success")
         except Exception as e:
             db.session.rollback()
@@ -777,10 +952,47 @@ def admin_reset_faculty_password(user_id):
 # Logout
 @app.route("/logout")
 def logout():
+    sid = session.pop("sid", None)
+    if sid:
+        end_session(sid, principal_cache)
     session.pop("user", None)
     flash("Logged out successfully", "info")
     return redirect(url_for("home"))
 
+# CLI: archive old bookings (cron target), e.g. `flask --app app archive-bookings --days 90`
+@app.cli.command("archive-bookings")
+@click.option("--days", type=int, default=None, help="Archive bookings older than this many days.")
+@click.option("--batch-size", type=int, default=None, help="Rows moved per transaction.")
+def archive_bookings_command(days, batch_size):
+    days = app.config["ARCHIVE_AFTER_DAYS"] if days is None else days
+    batch_size = batch_size or app.config["ARCHIVE_BATCH_SIZE"]
+    moved = archive_bookings(archive_cutoff(days), batch_size)
+    click.echo(f"Archived {moved} booking(s) dated before {archive_cutoff(days)}")
+
+# CLI: rebuild utilization rollups from scratch, e.g. `flask --app app rebuild-rollups`
+@app.cli.command("rebuild-rollups")
+def rebuild_rollups_command():
+    click.echo(f"Rebuilt {rebuild_usage()} venue usage rollup(s)")
+
+# CLI: one pending-booking sweep (cron target), e.g. `flask --app app sweep-pending`
+@app.cli.command("sweep-pending")
+def sweep_pending_command():
+    result = sweep_pending(app.config, notify=send_booking_email_to_admin)
+    click.echo(f"Expired {result['expired']} booking(s), re-notified {result['renotified']} group(s)")
+
+# CLI: fingerprint static assets for production, e.g. `flask --app app build-assets`
+@app.cli.command("build-assets")
+def build_assets_command():
+    manifest = build_manifest(app.static_folder)
+    click.echo(f"Wrote {len(manifest)} fingerprinted asset(s) to static/{MANIFEST_NAME}")
+
+# CLI: delete hashed files the current manifest no longer uses. Run it only after
+# every worker has restarted on the new manifest, e.g. `flask --app app prune-assets`
+@app.cli.command("prune-assets")
+def prune_assets_command():
+    removed = prune_dist(app.static_folder)
+    click.echo(f"Removed {len(removed)} stale fingerprinted asset(s)")
+
 
 if __name__ == "__main__":
     app.run(host="0.0.0.0", port=5000, debug=True)
\ No newline at end of file
@@ -0,0 +1,61 @@
+# archive.py
+# Moves past bookings out of the hot `booking` table into `booking_archive`.
+from datetime import date, datetime, timedelta
+from sqlalchemy import select, insert, delete, literal, union_all
+from database import db
+from models import Booking, BookingArchive
+
+# Columns copied verbatim from booking -> booking_archive
+ARCHIVED_FIELDS = [
+    "event_name", "faculty_name", "num_people", "venue",
+    "slot", "date", "status", "canteen_details", "other_requirements",
+]
+
+def archive_cutoff(days: int) -> str:
+    """Returns the YYYY-MM-DD date before which bookings are archived."""
+    return (date.today() - timedelta(days=days)).isoformat()
+
+def archive_bookings(before: str, batch_size: int = 500) -> int:
+    """Moves bookings dated before `before` into the archive table.
+
+    Works in small batches, committing after each one, so the SQLite write
+    lock is only held for a moment and live requests keep flowing.
+    Returns the number of bookings moved.
+    """
+    archived_at = datetime.now().isoformat(timespec="seconds")
+    moved = 0
+    while True:
+        ids = db.session.scalars(
+            select(Booking.id).where(Booking.date < before).order_by(Booking.date, Booking.id).limit(batch_size)
+        ).all()
+        if not ids:
+            break
+        try:
+            source = select(
+                Booking.id,
+                *[getattr(Booking, name) for name in ARCHIVED_FIELDS],
+                literal(archived_at),
+            ).where(Booking.id.in_(ids)).order_by(Booking.id)
+            db.session.execute(insert(BookingArchive).from_select(["booking_id"] + ARCHIVED_FIELDS + ["archived_at"], source))
+            db.session.execute(delete(Booking).where(Booking.id.in_(ids)))
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+        moved += len(ids)
+    return moved
+
+def booking_history(include_archived: bool = True):
+    """Returns live (and optionally archived) booking rows for exports and reports.
+
+    Each row has the booking fields plus an `archived` flag.
+    """
+    live = select(Booking.id, *[getattr(Booking, name) for name in ARCHIVED_FIELDS], literal(False).label("archived"))
+    if not include_archived:
+        query = live.order_by(Booking.date.desc(), Booking.id.asc())
+        return db.session.execute(query).all()
+    archived = select(BookingArchive.booking_id.label("id"), *[getattr(BookingArchive, name) for name in ARCHIVED_FIELDS],
+                      literal(True).label("archived"))
+    history = union_all(live, archived).subquery()
+    query = select(history).order_by(history.c.date.desc(), history.c.id.asc())
+    return db.session.execute(query).all()
@@ -0,0 +1,66 @@
+# assets.py
+# Fingerprinted static assets: a build step copies each file to static/dist/
+# under a content-hashed name and records the mapping in static/manifest.json.
+import hashlib, json, os, shutil
+
+DIST_DIR = "dist"
+MANIFEST_NAME = "manifest.json"
+ASSET_EXTENSIONS = (".css", ".js", ".png", ".jpg", ".jpeg", ".svg", ".ico", ".woff2")
+
+def build_manifest(static_folder: str) -> dict:
+    """Writes hashed copies of every static asset and returns the manifest.
+
+    e.g. "css/home.css" -> "dist/css/home.3f2a9c1b7d4e.css"
+
+    Files from earlier builds are kept, because pages rendered by workers
+    still on the old manifest point to them; see prune_dist().
+    """
+    dist_root = os.path.join(static_folder, DIST_DIR)
+    manifest = {}
+    for root, dirs, files in os.walk(static_folder):
+        dirs[:] = [d for d in dirs if os.path.join(root, d) != dist_root]
+        for filename in sorted(files):
+            if not filename.lower().endswith(ASSET_EXTENSIONS):
+                continue
+            source = os.path.join(root, filename)
+            logical = os.path.relpath(source, static_folder).replace(os.sep, "/")
+            with open(source, "rb") as f:
+                digest = hashlib.sha256(f.read()).hexdigest()[:12]
+            stem, ext = os.path.splitext(logical)
+            hashed = f"{DIST_DIR}/{stem}.{digest}{ext}"
+            target = os.path.join(static_folder, *hashed.split("/"))
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            shutil.copyfile(source, target)
+            manifest[logical] = hashed
+    manifest_path = os.path.join(static_folder, MANIFEST_NAME)
+    with open(manifest_path + ".tmp", "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(manifest_path + ".tmp", manifest_path)
+    return manifest
+
+def prune_dist(static_folder: str) -> list:
+    """Deletes files in static/dist/ that the current manifest does not reference."""
+    dist_root = os.path.join(static_folder, DIST_DIR)
+    manifest = load_manifest(static_folder)
+    if not manifest:
+        return []  # No current build to compare against; keep everything
+    keep = {os.path.normpath(os.path.join(static_folder, *hashed.split("/"))) for hashed in manifest.values()}
+    removed = []
+    for root, _, files in os.walk(dist_root):
+        for filename in files:
+            path = os.path.normpath(os.path.join(root, filename))
+            if path not in keep:
+                os.remove(path)
+                removed.append(os.path.relpath(path, static_folder).replace(os.sep, "/"))
+    return removed
+
+def load_manifest(static_folder: str) -> dict:
+    """Returns the built manifest, or {} when the build step has not been run."""
+    try:
+        with open(os.path.join(static_folder, MANIFEST_NAME)) as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+def is_fingerprinted(filename: str) -> bool:
+    return filename.startswith(DIST_DIR + "/")
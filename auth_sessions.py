@@ -0,0 +1,91 @@
+# auth_sessions.py
+# Server-side login sessions with a per-worker cache of user principals.
+import os, secrets, threading, time
+from database import db
+from models import User, UserSession
+
+class PrincipalCache:
+    """sid -> principal dict, kept for `ttl` seconds (never past the session's
+    own expiry) and dropped whenever the shared revocation generation (mtime
+    of a file in instance/) changes.
+
+    Checking the generation is an os.stat(), so cache hits cost no query and a
+    revoke in one worker is seen by every other worker on its next request.
+    """
+
+    def __init__(self, generation_path: str, ttl: float = 60):
+        self.generation_path = generation_path
+        self.ttl = ttl
+        self._entries = {}
+        self._lock = threading.Lock()
+        self._generation = self._current_generation()
+
+    def _current_generation(self):
+        try:
+            return os.stat(self.generation_path).st_mtime_ns
+        except FileNotFoundError:
+            return 0
+
+    def get(self, sid):
+        generation = self._current_generation()
+        with self._lock:
+            if generation != self._generation:
+                self._entries.clear()
+                self._generation = generation
+            now = time.time()
+            stale = [key for key, (_, valid_until) in self._entries.items() if valid_until <= now]
+            for key in stale:
+                del self._entries[key]
+            entry = self._entries.get(sid)
+            return entry[0] if entry is not None else None
+
+    def put(self, sid, principal, expires_at: float):
+        """Caches `principal` until the TTL passes or the session expires, whichever is first."""
+        with self._lock:
+            self._entries[sid] = (principal, min(time.time() + self.ttl, expires_at))
+
+    def invalidate(self):
+        """Bumps the shared generation so every worker drops its cached principals."""
+        with open(self.generation_path, "a"):
+            pass
+        now = time.time_ns()
+        os.utime(self.generation_path, ns=(now, now))
+        with self._lock:
+            self._entries.clear()
+
+def create_session(user: User, lifetime: int) -> str:
+    """Stores a new session for `user` and returns its id."""
+    now = int(time.time())
+    sid = secrets.token_urlsafe(32)
+    # Opportunistic cleanup of expired sessions
+    UserSession.query.filter(UserSession.expires_at < now).delete()
+    db.session.add(UserSession(sid=sid, user_id=user.id, created_at=now, expires_at=now + lifetime))
+    db.session.commit()
+    return sid
+
+def load_principal(sid: str, cache: PrincipalCache):
+    """Returns {"id", "username", "role"} for a live session, or None."""
+    principal = cache.get(sid)
+    if principal is not None:
+        return principal
+    row = db.session.query(UserSession, User).join(User, User.id == UserSession.user_id) \
+        .filter(UserSession.sid == sid, UserSession.expires_at >= int(time.time())).first()
+    if row is None:
+        return None
+    user_session, user = row
+    principal = {"id": user.id, "username": user.username, "role": user.role}
+    cache.put(sid, principal, user_session.expires_at)
+    return principal
+
+def end_session(sid: str, cache: PrincipalCache):
+    UserSession.query.filter_by(sid=sid).delete()
+    db.session.commit()
+    cache.invalidate()
+
+def revoke_user_sessions(user_id: int):
+    """Deletes every session of a user inside the caller's transaction.
+
+    Call cache.invalidate() after the commit, so no worker can re-cache a
+    session that is about to disappear.
+    """
+    UserSession.query.filter_by(user_id=user_id).delete()
@@ -0,0 +1,84 @@
+# bench_singleflight.py
+# Micro-benchmark: many threads asking for the same (venue, date) at once,
+# with and without SingleFlight. Uses a throwaway SQLite file, not the app DB.
+#
+#   python bench_singleflight.py --threads 64 --rounds 20
+import argparse, os, sqlite3, statistics, tempfile, threading, time
+from singleflight import SingleFlight
+
+VENUES = ["Auditorium", "Conference Room", "Lab 1", "Lab 2"]
+SLOTS = ["8:30-9:30", "9:30-10:30", "10:50-11:50", "11:50-12:50", "1:30-2:30", "2:30-3:30"]
+
+def make_db(path: str, rows: int):
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE booking (id INTEGER PRIMARY KEY, venue TEXT, date TEXT, slot TEXT, status TEXT)")
+    conn.executemany(
+        "INSERT INTO booking (venue, date, slot, status) VALUES (?, ?, ?, ?)",
+        ((VENUES[i % 4], f"2030-{1 + i % 12:02d}-{1 + i % 28:02d}", SLOTS[i % 6], "Approved" if i % 3 else "Pending")
+         for i in range(rows)),
+    )
+    # Same index the app uses for (venue, date) lookups (ix_booking_venue_date)
+    conn.execute("CREATE INDEX ix_booking_venue_date ON booking (venue, date)")
+    conn.commit()
+    conn.close()
+
+def run(path: str, threads: int, rounds: int, coalesce: bool):
+    local = threading.local()
+    flight = SingleFlight()
+    queries = 0
+    count_lock = threading.Lock()
+    latencies = []
+
+    def query(venue, date):
+        nonlocal queries
+        if not hasattr(local, "conn"):
+            local.conn = sqlite3.connect(path, check_same_thread=False)
+        with count_lock:
+            queries += 1
+        return local.conn.execute(
+            "SELECT slot, status FROM booking WHERE venue = ? AND date = ?", (venue, date)
+        ).fetchall()
+
+    def lookup(venue, date):
+        if coalesce:
+            return flight.do((venue, date), lambda: query(venue, date))
+        return query(venue, date)
+
+    for _ in range(rounds):
+        barrier = threading.Barrier(threads)
+        round_latencies = []
+
+        def worker():
+            barrier.wait()
+            start = time.perf_counter()
+            lookup("Lab 1", "2030-05-05")
+            round_latencies.append(time.perf_counter() - start)
+
+        workers = [threading.Thread(target=worker) for _ in range(threads)]
+        for t in workers:
+            t.start()
+        for t in workers:
+            t.join()
+        latencies.extend(round_latencies)
+
+    latencies.sort()
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    return queries, statistics.median(latencies) * 1000, p99 * 1000
+
+def main():
+    parser = argparse.ArgumentParser(description="Single-flight availability lookup benchmark")
+    parser.add_argument("--threads", type=int, default=64)
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--rows", type=int, default=200000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.db")
+        make_db(path, args.rows)
+        print(f"{args.threads} threads x {args.rounds} rounds, {args.rows} bookings (indexed on venue, date)")
+        for label, coalesce in (("direct", False), ("single-flight", True)):
+            queries, p50, p99 = run(path, args.threads, args.rounds, coalesce)
+            print(f"{label:>14}: {queries:5d} queries  p50 {p50:8.2f} ms  p99 {p99:8.2f} ms")
+
+if __name__ == "__main__":
+    main()
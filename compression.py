@@ -0,0 +1,42 @@
+# compression.py
+# gzip/brotli for dynamic text responses (HTML, JSON, CSV) above a size threshold.
+import gzip
+
+try:
+    import brotli  # Optional: pip install brotli
+except ImportError:
+    brotli = None
+
+COMPRESSIBLE_TYPES = ("text/html", "application/json", "text/csv", "text/plain")
+
+def _accepts(accept_encoding: str, coding: str) -> bool:
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        if name.strip().lower() == coding:
+            return params.replace(" ", "") not in ("q=0", "q=0.0")
+    return False
+
+def compress_response(response, accept_encoding: str, min_size: int = 1024, level: int = 6):
+    """Compresses `response` in place when the client accepts it and it is worth it."""
+    if (response.direct_passthrough  # send_file / static files
+            or response.is_streamed
+            or response.status_code < 200 or response.status_code in (204, 206, 304)
+            or "Content-Encoding" in response.headers
+            or response.mimetype not in COMPRESSIBLE_TYPES):
+        return response
+
+    response.vary.add("Accept-Encoding")
+    data = response.get_data()
+    if len(data) < min_size:
+        return response
+
+    if brotli is not None and _accepts(accept_encoding, "br"):
+        body, coding = brotli.compress(data, quality=5), "br"
+    elif _accepts(accept_encoding, "gzip"):
+        body, coding = gzip.compress(data, compresslevel=level), "gzip"
+    else:
+        return response
+
+    response.set_data(body)
+    response.headers["Content-Encoding"] = coding
+    return response
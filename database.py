@@ -1,4 +1,19 @@
 # database.py
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import inspect, text
 
 db = SQLAlchemy()
+
+def add_missing_columns(table_name: str, columns: dict):
+    """Adds columns introduced after a table was first created (no migrations tool here).
+
+    `columns` maps column name -> SQL type/default clause, e.g. {"created_at": "INTEGER"}.
+    """
+    existing = {c["name"] for c in inspect(db.engine).get_columns(table_name)}
+    missing = {name: ddl for name, ddl in columns.items() if name not in existing}
+    if not missing:
+        return []
+    with db.engine.begin() as conn:
+        for name, ddl in missing.items():
+            conn.execute(text(f"ALTER TABLE {table_name} ADD COLUMN {name} {ddl}"))
+    return list(missing)
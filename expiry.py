@@ -0,0 +1,135 @@
+# expiry.py
+# Sweeps stale Pending bookings: re-notifies the admin, then expires them.
+import os, socket, threading, time
+from itertools import groupby
+from sqlalchemy import update, or_
+from sqlalchemy.exc import IntegrityError
+from database import db
+from models import Booking, SchedulerLease
+from rollups import refresh_usage
+from structured_logging import get_logger
+
+log = get_logger("expiry")
+
+SWEEP_LEASE = "pending-sweeper"
+
+def acquire_lease(name: str, owner: str, ttl: float) -> bool:
+    """Takes or renews the named lease; only one worker holds it at a time."""
+    now = time.time()
+    if db.session.get(SchedulerLease, name) is None:
+        try:
+            db.session.add(SchedulerLease(name=name, owner=owner, expires_at=now + ttl))
+            db.session.commit()
+            return True
+        except IntegrityError:
+            db.session.rollback()  # Another worker created it first
+    # Single UPDATE, so the check-and-take is atomic under SQLite's write lock
+    result = db.session.execute(
+        update(SchedulerLease)
+        .where(SchedulerLease.name == name, or_(SchedulerLease.owner == owner, SchedulerLease.expires_at < now))
+        .values(owner=owner, expires_at=now + ttl)
+    )
+    db.session.commit()
+    return result.rowcount == 1
+
+def _pending_batch(column, cutoff: int, batch_size: int):
+    # Served by the (status, created_at) / (status, notified_at) indexes
+    return Booking.query.filter(Booking.status == "Pending", column < cutoff) \
+        .order_by(column.asc(), Booking.id.asc()).limit(batch_size).all()
+
+def expire_pending(older_than: int, batch_size: int = 200) -> int:
+    """Marks Pending bookings created before `older_than` (epoch seconds) as Expired.
+
+    Commits per batch and refreshes the venue rollups for every touched
+    (venue, date), which frees the slots in availability views.
+    """
+    expired = 0
+    while True:
+        batch = _pending_batch(Booking.created_at, older_than, batch_size)
+        if not batch:
+            break
+        try:
+            for booking in batch:
+                booking.status = "Expired"
+            refresh_usage([(b.venue, b.date) for b in batch])
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+        expired += len(batch)
+    return expired
+
+def renotify_pending(older_than: int, notify, batch_size: int = 200) -> int:
+    """Re-sends the admin email (with fresh decision links) for pending groups last notified before `older_than`.
+
+    notified_at is stamped on every pending slot of a group, including slots
+    past the batch boundary, because one email covers them all. It is
+    committed before any email goes out, so the slow SMTP round-trips never
+    run while the SQLite write lock is held.
+    """
+    groups = 0
+    while True:
+        batch = _pending_batch(Booking.notified_at, older_than, batch_size)
+        if not batch:
+            break
+        now = int(time.time())
+        event_key = lambda b: (b.faculty_name, b.venue, b.date, b.event_name)
+        to_notify = []
+        try:
+            for (faculty_name, venue, date, event_name), related in groupby(sorted(batch, key=event_key), key=event_key):
+                to_notify.append(next(related).id)
+                db.session.execute(
+                    update(Booking)
+                    .where(Booking.faculty_name == faculty_name, Booking.venue == venue, Booking.date == date,
+                           Booking.event_name == event_name, Booking.status == "Pending")
+                    .values(notified_at=now),
+                    execution_options={"synchronize_session": False},
+                )
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+        for booking_id in to_notify:
+            booking = db.session.get(Booking, booking_id)
+            if booking is not None and booking.status == "Pending":
+                notify(booking)
+            db.session.commit()  # Ends the read transaction opened by notify's queries
+        groups += len(to_notify)
+    return groups
+
+def sweep_pending(config, notify=None) -> dict:
+    """Runs one sweep using the PENDING_* settings in `config`."""
+    now = int(time.time())
+    batch_size = config["PENDING_SWEEP_BATCH_SIZE"]
+    renotified = 0
+    expire_after = config["PENDING_EXPIRE_AFTER_HOURS"] * 3600
+    renotify_after = config["PENDING_RENOTIFY_AFTER_HOURS"] * 3600
+    # Expire first so nothing is re-notified moments before it expires
+    expired = expire_pending(now - expire_after, batch_size) if expire_after > 0 else 0
+    if notify is not None and renotify_after > 0:
+        renotified = renotify_pending(now - renotify_after, notify, batch_size)
+    return {"expired": expired, "renotified": renotified}
+
+def start_sweeper(app, notify=None):
+    """Starts the in-process sweeper thread; workers elect a leader through SchedulerLease."""
+    interval = app.config["PENDING_SWEEP_INTERVAL"]
+    owner = f"{socket.gethostname()}:{os.getpid()}"
+
+    def run():
+        while True:
+            with app.app_context():
+                try:
+                    if acquire_lease(SWEEP_LEASE, owner, ttl=interval * 2):
+                        result = sweep_pending(app.config, notify)
+                        if result["expired"] or result["renotified"]:
+                            log.info("Pending sweep finished", extra=result)
+                except Exception:
+                    db.session.rollback()
+                    log.exception("Pending sweep failed")
+                finally:
+                    db.session.remove()
+            time.sleep(interval)
+
+    thread = threading.Thread(target=run, name="pending-sweeper", daemon=True)
+    thread.start()
+    return thread
@@ -1,4 +1,5 @@
 # models.py
+import time
 from database import db
 
 class User(db.Model):
@@ -22,6 +23,16 @@ class Booking(db.Model):
     status = db.Column(db.String(20), default="Pending")  # Pending / Approved / Rejected
     canteen_details = db.Column(db.Text, nullable=True)
     other_requirements = db.Column(db.Text, nullable=True)
+    created_at = db.Column(db.Integer, nullable=True, default=lambda: int(time.time()))  # epoch seconds
+    notified_at = db.Column(db.Integer, nullable=True, default=lambda: int(time.time()))  # last admin email
+
+# Indexes used by the pending-booking sweeper (see expiry.py)
+booking_pending_created_index = db.Index("ix_booking_status_created_at", Booking.status, Booking.created_at)
+booking_pending_notified_index = db.Index("ix_booking_status_notified_at", Booking.status, Booking.notified_at)
+# Used by the archive job (date < cutoff)
+booking_date_index = db.Index("ix_booking_date", Booking.date)
+# Used by rollup refreshes and availability lookups for one (venue, date)
+booking_venue_date_index = db.Index("ix_booking_venue_date", Booking.venue, Booking.date)
 
 
 class Venue(db.Model):
@@ -30,4 +41,52 @@ class Venue(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(100), unique=True, nullable=False)
     capacity = db.Column(db.Integer, nullable=False)
-    location = db.Column(db.String(100), nullable=True)
\ No newline at end of file
+    location = db.Column(db.String(100), nullable=True)
+
+class BookingArchive(db.Model):
+    __tablename__ = 'booking_archive'
+    __table_args__ = {'extend_existing': True}
+    id = db.Column(db.Integer, primary_key=True)
+    booking_id = db.Column(db.Integer, nullable=False, index=True)  # Original booking id; SQLite may reuse it
+    event_name = db.Column(db.String(100), nullable=False)
+    faculty_name = db.Column(db.String(50), nullable=False)
+    num_people = db.Column(db.Integer, nullable=False)
+    venue = db.Column(db.String(50), nullable=False)
+    slot = db.Column(db.String(20), nullable=False)
+    date = db.Column(db.String(20), nullable=False, index=True)
+    status = db.Column(db.String(20), default="Pending")
+    canteen_details = db.Column(db.Text, nullable=True)
+    other_requirements = db.Column(db.Text, nullable=True)
+    archived_at = db.Column(db.String(20), nullable=False)
+
+
+# Per-venue, per-day rollup of bookings, kept in sync by the write routes (see rollups.py)
+class VenueDailyUsage(db.Model):
+    __tablename__ = 'venue_daily_usage'
+    __table_args__ = {'extend_existing': True}
+    venue = db.Column(db.String(50), primary_key=True)
+    date = db.Column(db.String(20), primary_key=True)
+    pending = db.Column(db.Integer, nullable=False, default=0)
+    approved = db.Column(db.Integer, nullable=False, default=0)
+    rejected = db.Column(db.Integer, nullable=False, default=0)
+    approved_mask = db.Column(db.Integer, nullable=False, default=0)  # bit i set = SLOTS[i] approved
+    pending_mask = db.Column(db.Integer, nullable=False, default=0)
+
+
+# Lease row used to elect one worker to run a periodic background job
+class SchedulerLease(db.Model):
+    __tablename__ = 'scheduler_lease'
+    __table_args__ = {'extend_existing': True}
+    name = db.Column(db.String(50), primary_key=True)
+    owner = db.Column(db.String(100), nullable=False)
+    expires_at = db.Column(db.Float, nullable=False)
+
+
+# Server-side login session; the signed cookie only carries `sid`
+class UserSession(db.Model):
+    __tablename__ = 'user_session'
+    __table_args__ = {'extend_existing': True}
+    sid = db.Column(db.String(64), primary_key=True)
+    user_id = db.Column(db.Integer, nullable=False, index=True)
+    created_at = db.Column(db.Integer, nullable=False)
+    expires_at = db.Column(db.Integer, nullable=False)
@@ -0,0 +1,112 @@
+# rollups.py
+# Pre-aggregated venue utilization, one VenueDailyUsage row per (venue, date).
+from datetime import date as date_cls
+from sqlalchemy import select, union_all
+from database import db
+from models import Booking, BookingArchive, VenueDailyUsage
+
+# Bookable slots in display order; bit i of the slot masks stands for SLOTS[i]
+SLOTS = ["8:30-9:30", "9:30-10:30", "10:50-11:50", "11:50-12:50", "1:30-2:30", "2:30-3:30"]
+SLOT_BITS = {slot: 1 << i for i, slot in enumerate(SLOTS)}
+
+def _booking_rows(venue=None, date=None):
+    """(venue, date, slot, status) for live and archived bookings, optionally for one key."""
+    queries = []
+    for model in (Booking, BookingArchive):
+        query = select(model.venue, model.date, model.slot, model.status)
+        if venue is not None:
+            query = query.where(model.venue == venue, model.date == date)
+        queries.append(query)
+    return db.session.execute(union_all(*queries)).all()
+
+def _apply(usage: VenueDailyUsage, slot: str, status: str):
+    bit = SLOT_BITS.get(slot, 0)
+    if status == "Approved":
+        usage.approved += 1
+        usage.approved_mask |= bit
+    elif status == "Pending":
+        usage.pending += 1
+        usage.pending_mask |= bit
+    elif status == "Rejected":
+        usage.rejected += 1
+
+def _empty_usage(venue: str, date: str) -> VenueDailyUsage:
+    return VenueDailyUsage(venue=venue, date=date, pending=0, approved=0, rejected=0,
+                           approved_mask=0, pending_mask=0)
+
+def refresh_usage(keys):
+    """Recomputes the rollup rows for the given (venue, date) keys.
+
+    Call this inside the write route's transaction, before its commit, so the
+    rollup and the bookings change atomically. Only the touched keys are read.
+    """
+    for venue, date in set(keys):
+        rows = _booking_rows(venue, date)
+        usage = db.session.get(VenueDailyUsage, (venue, date))
+        if not rows:
+            if usage is not None:
+                db.session.delete(usage)
+            continue
+        if usage is None:
+            usage = _empty_usage(venue, date)
+            db.session.add(usage)
+        usage.pending = usage.approved = usage.rejected = 0
+        usage.approved_mask = usage.pending_mask = 0
+        for _, _, slot, status in rows:
+            _apply(usage, slot, status)
+
+def rebuild_usage() -> int:
+    """Rebuilds every rollup row from live and archived bookings (backfill)."""
+    try:
+        VenueDailyUsage.query.delete()
+        rollups = {}
+        for venue, date, slot, status in _booking_rows():
+            usage = rollups.get((venue, date))
+            if usage is None:
+                usage = rollups[(venue, date)] = _empty_usage(venue, date)
+            _apply(usage, slot, status)
+        db.session.add_all(rollups.values())
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+    return len(rollups)
+
+def _week_of(date: str) -> str:
+    try:
+        year, week, _ = date_cls.fromisoformat(date).isocalendar()
+    except ValueError:
+        return date
+    return f"{year}-W{week:02d}"
+
+def usage_report(venue=None, start=None, end=None) -> dict:
+    """Builds the analytics payload from the rollup table only."""
+    query = VenueDailyUsage.query
+    if venue:
+        query = query.filter(VenueDailyUsage.venue == venue)
+    if start:
+        query = query.filter(VenueDailyUsage.date >= start)
+    if end:
+        query = query.filter(VenueDailyUsage.date <= end)
+
+    venues = {}
+    for usage in query.order_by(VenueDailyUsage.venue.asc(), VenueDailyUsage.date.asc()).all():
+        report = venues.setdefault(usage.venue, {
+            "pending": 0, "approved": 0, "rejected": 0,
+            "daily": [], "weekly": {}, "peak_hours": {slot: 0 for slot in SLOTS},
+        })
+        report["pending"] += usage.pending
+        report["approved"] += usage.approved
+        report["rejected"] += usage.rejected
+        report["daily"].append({"date": usage.date, "approved": usage.approved, "pending": usage.pending})
+        week = _week_of(usage.date)
+        report["weekly"][week] = report["weekly"].get(week, 0) + usage.approved
+        for slot, bit in SLOT_BITS.items():
+            if usage.approved_mask & bit:
+                report["peak_hours"][slot] += 1
+
+    for report in venues.values():
+        decided = report["approved"] + report["rejected"]
+        report["approval_rate"] = round(report["approved"] / decided, 3) if decided else None
+        report["weekly"] = [{"week": week, "approved": count} for week, count in report["weekly"].items()]
+    return {"slots": SLOTS, "venues": venues}
@@ -0,0 +1,57 @@
+# singleflight.py
+# Coalesces identical concurrent lookups within one worker process.
+import threading
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+class SingleFlight:
+    """Runs at most one `fn()` per key at a time; callers that arrive while it
+    is running wait for it and share its result (or its exception).
+
+    Nothing is kept after the call finishes, but a shared result can be one
+    flight old: a caller may join a query that started before a write it
+    just saw commit. Writers in this process call `forget(key)` after
+    committing so later callers start a fresh flight; writes made by other
+    workers or threads that don't call it can still be one flight behind.
+    `fn` must return plain data, not ORM objects bound to the leader's session.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key, fn):
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                if self._calls.get(key) is call:
+                    del self._calls[key]
+            call.done.set()
+        return call.result
+
+    def forget(self, key):
+        """Detaches any in-flight call for `key`; callers arriving later start a new one."""
+        with self._lock:
+            self._calls.pop(key, None)
@@ -0,0 +1,68 @@
+document.addEventListener('DOMContentLoaded', function() {
+  const form = document.getElementById('analytics-filters');
+  const results = document.getElementById('analytics-results');
+
+  function escapeHtml(s) {
+    const div = document.createElement('div');
+    div.textContent = s;
+    return div.innerHTML;
+  }
+
+  function bars(items) {
+    const max = Math.max(1, ...items.map(i => i.value));
+    if (!items.length) return '<p class="empty">No data</p>';
+    return '<div class="bars">' + items.map(i => `
+      <div class="bar-row">
+        <span>${escapeHtml(i.label)}</span>
+        <div class="bar-track"><div class="bar-fill" style="width:${(i.value / max) * 100}%"></div></div>
+        <span>${i.value}</span>
+      </div>`).join('') + '</div>';
+  }
+
+  function render(data) {
+    const names = Object.keys(data.venues);
+    if (!names.length) {
+      results.innerHTML = '<div class="card"><p class="empty">No bookings in this range.</p></div>';
+      return;
+    }
+    results.innerHTML = names.map(name => {
+      const v = data.venues[name];
+      const rate = v.approval_rate === null ? '-' : Math.round(v.approval_rate * 100) + '%';
+      return `
+        <div class="card">
+          <h2>${escapeHtml(name)}</h2>
+          <div class="summary">
+            <div><strong>${v.approved}</strong><span>Approved slots</span></div>
+            <div><strong>${v.pending}</strong><span>Pending slots</span></div>
+            <div><strong>${v.rejected}</strong><span>Rejected slots</span></div>
+            <div><strong>${rate}</strong><span>Approval rate</span></div>
+          </div>
+          <h3>Peak hours (days booked per slot)</h3>
+          ${bars(data.slots.map(s => ({ label: s, value: v.peak_hours[s] })))}
+          <h3>Slots booked per week</h3>
+          ${bars(v.weekly.map(w => ({ label: w.week, value: w.approved })))}
+          <h3>Slots booked per day</h3>
+          ${bars(v.daily.map(d => ({ label: d.date, value: d.approved })))}
+        </div>`;
+    }).join('');
+  }
+
+  async function load() {
+    const params = new URLSearchParams(new FormData(form));
+    results.innerHTML = '<div class="card"><p class="empty">Loading...</p></div>';
+    try {
+      const resp = await fetch('/admin/analytics.json?' + params.toString());
+      if (!resp.ok) throw new Error(resp.status);
+      render(await resp.json());
+    } catch (e) {
+      console.error('Error loading analytics:', e);
+      results.innerHTML = '<div class="card"><p class="empty">Failed to load analytics.</p></div>';
+    }
+  }
+
+  form.addEventListener('submit', function(e) {
+    e.preventDefault();
+    load();
+  });
+  load();
+});
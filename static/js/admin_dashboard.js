@@ -0,0 +1,304 @@
+document.addEventListener('DOMContentLoaded', function() {
+  // Modal logic
+  const backdrop = document.getElementById('detailBackdrop');
+  const closeBtn = document.getElementById('detailClose');
+  const d = {
+    id: document.getElementById('d_id'),
+    event: document.getElementById('d_event'),
+    faculty: document.getElementById('d_faculty'),
+    venue: document.getElementById('d_venue'),
+    date: document.getElementById('d_date'),
+    slots: document.getElementById('d_slots'),
+    people: document.getElementById('d_people'),
+    canteen: document.getElementById('d_canteen'),
+    canteenRow: document.getElementById('row_canteen'),
+    status: document.getElementById('d_status')
+  };
+  const approveForm = document.getElementById('detailApproveForm');
+  const rejectForm = document.getElementById('detailRejectForm');
+
+  // Admin Calendar functionality
+  const adminVenueSelect = document.getElementById('admin-venue-select');
+  const adminCalendar = document.getElementById('admin-calendar');
+  const adminCalTitle = document.getElementById('admin-cal-title');
+  const adminCalGrid = document.getElementById('admin-cal-grid');
+  const adminCalPrev = document.getElementById('admin-cal-prev');
+  const adminCalNext = document.getElementById('admin-cal-next');
+  const adminSelectedDate = document.getElementById('admin-selected-date');
+  const slotDetailsBackdrop = document.getElementById('slotDetailsBackdrop');
+  const slotDetailsClose = document.getElementById('slotDetailsClose');
+  const slotDetailsContent = document.getElementById('slot-details-content');
+
+  let adminCalendarState = { year: new Date().getFullYear(), month: new Date().getMonth() };
+  let adminSelectedDateValue = '';
+  let adminSlotData = {};
+
+  const classSlots = [
+    "8:30-9:30",
+    "9:30-10:30", 
+    "10:50-11:50",
+    "11:50-12:50",
+    "1:30-2:30",
+    "2:30-3:30"
+  ];
+
+  // Calendar utility functions
+  function pad2(n) { return n < 10 ? '0' + n : '' + n; }
+  function formatDateYmd(d) {
+    const y = d.getFullYear();
+    const m = pad2(d.getMonth() + 1);
+    const day = pad2(d.getDate());
+    return `${y}-${m}-${day}`;
+  }
+
+  // Load slot data for admin calendar
+  async function loadAdminSlotData(venue, date) {
+    if (!venue || !date) return;
+
+    try {
+      const formData = new FormData();
+      formData.append('venue', venue);
+      formData.append('date', date);
+
+      const resp = await fetch('/admin/slot_details', { method: 'POST', body: formData });
+      if (resp.ok) {
+        const data = await resp.json();
+        adminSlotData[date] = data;
+      }
+    } catch (e) {
+      console.error('Error loading slot data:', e);
+    }
+  }
+
+  // Render admin calendar
+  function renderAdminCalendar() {
+    const monthNames = ["January", "February", "March", "April", "May", "June", 
+                       "July", "August", "September", "October", "November", "December"];
+
+    adminCalTitle.textContent = `${monthNames[adminCalendarState.month]} ${adminCalendarState.year}`;
+
+    const firstDay = new Date(adminCalendarState.year, adminCalendarState.month, 1);
+    const startDow = firstDay.getDay();
+    const daysInMonth = new Date(adminCalendarState.year, adminCalendarState.month + 1, 0).getDate();
+
+    adminCalGrid.innerHTML = '';
+
+    // Weekday headers
+    const weekdays = ['Sun', 'Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat'];
+    weekdays.forEach(w => {
+      const el = document.createElement('div');
+      el.textContent = w;
+      el.className = 'cal-weekday';
+      adminCalGrid.appendChild(el);
+    });
+
+    // Empty cells for days before month starts
+    for (let i = 0; i < startDow; i++) {
+      const empty = document.createElement('div');
+      empty.className = 'cal-day empty';
+      adminCalGrid.appendChild(empty);
+    }
+
+    // Days of the month
+    const todayYmd = formatDateYmd(new Date());
+    for (let d = 1; d <= daysInMonth; d++) {
+      const cell = document.createElement('div');
+      cell.textContent = d;
+      cell.className = 'cal-day';
+
+      const thisDate = new Date(adminCalendarState.year, adminCalendarState.month, d);
+      const ymd = formatDateYmd(thisDate);
+
+      if (ymd === todayYmd) cell.classList.add('today');
+      if (adminSelectedDateValue === ymd) cell.classList.add('selected');
+
+      // Add slot indicators
+      if (adminSlotData[ymd]) {
+        const slotData = adminSlotData[ymd];
+        const hasBooked = slotData.booked && slotData.booked.length > 0;
+        const hasPending = slotData.pending && slotData.pending.length > 0;
+
+        if (hasBooked) {
+          const indicator = document.createElement('div');
+          indicator.className = 'slot-indicator booked';
+          cell.appendChild(indicator);
+        } else if (hasPending) {
+          const indicator = document.createElement('div');
+          indicator.className = 'slot-indicator pending';
+          cell.appendChild(indicator);
+        } else {
+          const indicator = document.createElement('div');
+          indicator.className = 'slot-indicator available';
+          cell.appendChild(indicator);
+        }
+      }
+
+      cell.onclick = () => {
+        adminSelectedDateValue = ymd;
+        adminSelectedDate.textContent = `Selected date: ${ymd}`;
+        renderAdminCalendar();
+        showSlotDetails(ymd);
+      };
+
+      adminCalGrid.appendChild(cell);
+    }
+  }
+
+  // Show slot details modal
+  function showSlotDetails(date) {
+    const slotData = adminSlotData[date];
+    if (!slotData) return;
+
+    let content = `<h3 style="margin-bottom: 15px;">Slot Details for ${date}</h3>`;
+
+    // Show booked slots
+    if (slotData.booked && slotData.booked.length > 0) {
+      content += `<h4 style="color: var(--error); margin: 15px 0 10px 0;">🔴 Booked Slots</h4>`;
+      slotData.booked.forEach(booking => {
+        content += `
+          <div class="booking-item approved">
+            <strong>${booking.slot}</strong> - ${booking.event_name}<br>
+            <small>Faculty: ${booking.faculty_name} | People: ${booking.num_people}</small>
+            ${booking.canteen_details ? `<br><small style="color: var(--warning);">Canteen: ${booking.canteen_details}</small>` : ''}
+          </div>
+        `;
+      });
+    }
+
+    // Show pending slots
+    if (slotData.pending && slotData.pending.length > 0) {
+      content += `<h4 style="color: var(--warning); margin: 15px 0 10px 0;">🟡 Pending Approval</h4>`;
+      slotData.pending.forEach(booking => {
+        content += `
+          <div class="booking-item pending">
+            <strong>${booking.slot}</strong> - ${booking.event_name}<br>
+            <small>Faculty: ${booking.faculty_name} | People: ${booking.num_people}</small>
+            ${booking.canteen_details ? `<br><small style="color: var(--warning);">Canteen: ${booking.canteen_details}</small>` : ''}
+          </div>
+        `;
+      });
+    }
+
+    // Show available slots
+    const bookedSlots = slotData.booked ? slotData.booked.map(b => b.slot) : [];
+    const pendingSlots = slotData.pending ? slotData.pending.map(b => b.slot) : [];
+    const availableSlots = classSlots.filter(slot => 
+      !bookedSlots.includes(slot) && !pendingSlots.includes(slot)
+    );
+
+    if (availableSlots.length > 0) {
+      content += `<h4 style="color: var(--success); margin: 15px 0 10px 0;">🟢 Available Slots</h4>`;
+      content += `<div style="display: flex; flex-wrap: wrap; gap: 8px;">`;
+      availableSlots.forEach(slot => {
+        content += `<span class="slot-tag" style="background: var(--success);">${slot}</span>`;
+      });
+      content += `</div>`;
+    }
+
+    slotDetailsContent.innerHTML = content;
+    slotDetailsBackdrop.style.display = 'flex';
+  }
+
+  // Event listeners
+  adminVenueSelect.addEventListener('change', function() {
+    const venue = this.value;
+    if (venue) {
+      adminCalendar.style.display = 'block';
+      renderAdminCalendar();
+    } else {
+      adminCalendar.style.display = 'none';
+    }
+  });
+
+  adminCalPrev.addEventListener('click', function() {
+    adminCalendarState.month -= 1;
+    if (adminCalendarState.month < 0) {
+      adminCalendarState.month = 11;
+      adminCalendarState.year -= 1;
+    }
+    renderAdminCalendar();
+  });
+
+  adminCalNext.addEventListener('click', function() {
+    adminCalendarState.month += 1;
+    if (adminCalendarState.month > 11) {
+      adminCalendarState.month = 0;
+      adminCalendarState.year += 1;
+    }
+    renderAdminCalendar();
+  });
+
+  // Load slot data when venue changes
+  adminVenueSelect.addEventListener('change', async function() {
+    const venue = this.value;
+    if (venue) {
+      adminCalendar.style.display = 'block';
+      // Load data for current month
+      const firstDay = new Date(adminCalendarState.year, adminCalendarState.month, 1);
+      const lastDay = new Date(adminCalendarState.year, adminCalendarState.month + 1, 0);
+
+      for (let d = firstDay.getDate(); d <= lastDay.getDate(); d++) {
+        const date = formatDateYmd(new Date(adminCalendarState.year, adminCalendarState.month, d));
+        await loadAdminSlotData(venue, date);
+      }
+      renderAdminCalendar();
+    } else {
+      adminCalendar.style.display = 'none';
+    }
+  });
+
+  // Slot details modal
+  slotDetailsClose.addEventListener('click', function() {
+    slotDetailsBackdrop.style.display = 'none';
+  });
+
+  slotDetailsBackdrop.addEventListener('click', function(e) {
+    if (e.target === slotDetailsBackdrop) {
+      slotDetailsBackdrop.style.display = 'none';
+    }
+  });
+
+  function openModal(btn){
+    d.id.textContent = '#' + btn.dataset.id;
+    d.event.textContent = btn.dataset.event;
+    d.faculty.textContent = btn.dataset.faculty;
+    d.venue.textContent = btn.dataset.venue;
+    d.date.textContent = btn.dataset.date;
+
+    // Handle multiple slots
+    const slots = (btn.dataset.slots || '').split(',').filter(s => s.trim());
+    if (slots.length > 1) {
+      d.slots.innerHTML = `<div style="display: flex; flex-wrap: wrap; gap: 8px; margin-top: 5px;">
+        ${slots.map(slot => `<span class="slot-tag">${slot.trim()}</span>`).join('')}
+      </div>`;
+    } else {
+      d.slots.textContent = slots[0] || 'N/A';
+    }
+
+    d.people.textContent = btn.dataset.people;
+    d.status.textContent = btn.dataset.status;
+
+    // Handle canteen details
+    const c = (btn.dataset.canteen || '').trim();
+    if (c) { 
+      d.canteen.textContent = c; 
+      d.canteenRow.style.display = 'block'; 
+    } else { 
+      d.canteen.textContent = ''; 
+      d.canteenRow.style.display = 'none'; 
+    }
+
+    approveForm.action = '/admin/approve/' + btn.dataset.id;
+    rejectForm.action = '/admin/reject/' + btn.dataset.id;
+    // Expired requests can no longer be decided
+    const expired = btn.dataset.status === 'Expired';
+    approveForm.querySelector('button').disabled = expired || btn.dataset.status === 'Approved';
+    rejectForm.querySelector('button').disabled = expired || btn.dataset.status === 'Rejected';
+    backdrop.style.display = 'flex';
+  }
+  function closeModal(){ backdrop.style.display = 'none'; }
+  document.querySelectorAll('[data-open-modal]').forEach(b=>{ b.addEventListener('click', ()=> openModal(b)); });
+  closeBtn.addEventListener('click', closeModal);
+  backdrop.addEventListener('click', (e)=>{ if(e.target === backdrop){ closeModal(); } });
+  document.addEventListener('keydown', (e)=>{ if(e.key==='Escape'){ closeModal(); } });
+});
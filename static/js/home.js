@@ -0,0 +1,43 @@
+document.addEventListener('DOMContentLoaded', function() {
+  // Add a subtle fade-in animation for page elements
+  const card = document.querySelector('.card');
+  card.style.opacity = '0';
+  card.style.transform = 'translateY(20px)';
+
+  setTimeout(() => {
+    card.style.transition = 'opacity 0.5s ease, transform 0.5s ease';
+    card.style.opacity = '1';
+    card.style.transform = 'translateY(0)';
+  }, 100);
+
+  // Button hover effects
+  const buttons = document.querySelectorAll('.login-btn');
+  buttons.forEach(button => {
+    button.addEventListener('mouseenter', function() {
+      const icon = this.querySelector('i');
+      if (icon) {
+        icon.style.transform = 'translateX(3px)';
+      }
+    });
+
+    button.addEventListener('mouseleave', function() {
+      const icon = this.querySelector('i');
+      if (icon) {
+        icon.style.transform = 'translateX(0)';
+      }
+    });
+  });
+
+  // Feature card animations
+  const features = document.querySelectorAll('.feature');
+  features.forEach((feature, index) => {
+    feature.style.opacity = '0';
+    feature.style.transform = 'translateY(20px)';
+
+    setTimeout(() => {
+      feature.style.transition = 'opacity 0.5s ease, transform 0.5s ease';
+      feature.style.opacity = '1';
+      feature.style.transform = 'translateY(0)';
+    }, 300 + (index * 100));
+  });
+});
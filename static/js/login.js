@@ -0,0 +1,35 @@
+document.addEventListener('DOMContentLoaded', function() {
+  // Splash screen loading animation
+  const splashScreen = document.getElementById('splashScreen');
+
+  // Hide splash screen after a delay
+  setTimeout(() => {
+    splashScreen.classList.add('splash-hidden');
+  }, 3000); // 3 seconds delay
+
+  // Add subtle interaction effects
+  const loginOptions = document.querySelectorAll('.login-option');
+
+  loginOptions.forEach(option => {
+    option.addEventListener('mouseenter', function() {
+      const icon = this.querySelector('.login-icon');
+      icon.style.transform = 'scale(1.05)';
+    });
+
+    option.addEventListener('mouseleave', function() {
+      const icon = this.querySelector('.login-icon');
+      icon.style.transform = 'scale(1)';
+    });
+  });
+
+  // Add a subtle fade-in animation for page elements
+  const card = document.querySelector('.card');
+  card.style.opacity = '0';
+  card.style.transform = 'translateY(20px)';
+
+  setTimeout(() => {
+    card.style.transition = 'opacity 0.5s ease, transform 0.5s ease';
+    card.style.opacity = '1';
+    card.style.transform = 'translateY(0)';
+  }, 100);
+});
@@ -0,0 +1,50 @@
+document.addEventListener('DOMContentLoaded', function() {
+  // Add subtle interaction effects
+  const inputs = document.querySelectorAll('input');
+  inputs.forEach(input => {
+    input.addEventListener('focus', function() {
+      this.parentElement.style.transform = 'translateY(-2px)';
+    });
+
+    input.addEventListener('blur', function() {
+      this.parentElement.style.transform = 'translateY(0)';
+    });
+  });
+
+  // Login button animation
+  const loginBtn = document.querySelector('.login-btn');
+  loginBtn.addEventListener('mouseenter', function() {
+    const icon = this.querySelector('i');
+    icon.style.transform = 'translateX(3px)';
+  });
+
+  loginBtn.addEventListener('mouseleave', function() {
+    const icon = this.querySelector('i');
+    icon.style.transform = 'translateX(0)';
+  });
+
+  // Success message animation
+  const flash = document.querySelector('.flash');
+  if (flash) {
+    setTimeout(() => {
+      flash.style.opacity = '0';
+      flash.style.transform = 'translateY(-10px)';
+      setTimeout(() => {
+        if (flash.parentElement) {
+          flash.parentElement.removeChild(flash);
+        }
+      }, 500);
+    }, 5000);
+  }
+
+  // Add a subtle fade-in animation for page elements
+  const card = document.querySelector('.card');
+  card.style.opacity = '0';
+  card.style.transform = 'translateY(20px)';
+
+  setTimeout(() => {
+    card.style.transition = 'opacity 0.5s ease, transform 0.5s ease';
+    card.style.opacity = '1';
+    card.style.transform = 'translateY(0)';
+  }, 100);
+});
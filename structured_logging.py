@@ -0,0 +1,64 @@
+# structured_logging.py
+# JSON logs written by a background QueueListener, so request threads only
+# enqueue records and never block on stdout.
+import atexit, json, logging, queue, random, sys, time
+from logging.handlers import QueueHandler, QueueListener
+from flask import g, has_request_context
+
+LOGGER_NAME = "venue_booking"
+
+# Attributes every LogRecord has; anything else came in through `extra=`
+_RECORD_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime", "taskName"}
+
+def get_logger(name: str = None) -> logging.Logger:
+    return logging.getLogger(f"{LOGGER_NAME}.{name}" if name else LOGGER_NAME)
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record):
+        entry = {
+            "ts": time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(record.created)) + f".{int(record.msecs):03d}Z",
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRS and key != "sample_rate":
+                entry[key] = value
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+class RequestContextFilter(logging.Filter):
+    """Tags records with the current request id (runs in the logging thread's caller)."""
+    def filter(self, record):
+        if not hasattr(record, "request_id"):
+            record.request_id = g.get("request_id") if has_request_context() else None
+        return True
+
+class SamplingFilter(logging.Filter):
+    """Keeps a fraction of records logged with extra={"sample_rate": r}; others always pass."""
+    def filter(self, record):
+        rate = getattr(record, "sample_rate", None)
+        return rate is None or random.random() < rate
+
+def setup_logging(level: str = "INFO", stream=None) -> QueueListener:
+    """Routes the venue_booking loggers through a queue to a JSON stream handler."""
+    log_queue = queue.SimpleQueue()
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.addFilter(SamplingFilter())
+    queue_handler.addFilter(RequestContextFilter())
+    # Format in the caller so request context and exceptions are captured;
+    # the listener thread only does the write.
+    queue_handler.setFormatter(JsonFormatter())
+
+    output = logging.StreamHandler(stream or sys.stdout)
+    output.setFormatter(logging.Formatter("%(message)s"))
+    listener = QueueListener(log_queue, output, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
+    logger = get_logger()
+    logger.handlers[:] = [queue_handler]
+    logger.setLevel(level.upper())
+    logger.propagate = False
+    return listener
@@ -0,0 +1,20 @@
+# tests/conftest.py
+# Shared fixtures. Tests run against throwaway SQLite files, never instance/venue_booking.db.
+import os, sys
+import pytest
+from flask import Flask
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database import db
+
+@pytest.fixture
+def app(tmp_path):
+    """A bare Flask app bound to `db`, for testing modules that only need the models."""
+    app = Flask(__name__)
+    app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{tmp_path / 'test.db'}"
+    db.init_app(app)
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.session.remove()
@@ -0,0 +1,31 @@
+# tests/test_archive.py
+from database import db
+from models import Booking, BookingArchive
+from archive import archive_bookings, booking_history
+
+def make_booking(date, event="Seminar"):
+    booking = Booking(event_name=event, faculty_name="faculty", num_people=10,
+                      venue="Lab 1", slot="8:30-9:30", date=date)
+    db.session.add(booking)
+    db.session.commit()
+    return booking.id
+
+def test_archive_again_after_booking_id_is_reused(app):
+    make_booking("2020-01-01")
+    last_id = make_booking("2020-01-02")
+    assert archive_bookings("2021-01-01") == 2
+
+    # SQLite hands the archived rowid out again
+    reused_id = make_booking("2020-02-01", event="Workshop")
+    assert reused_id == 1
+
+    assert archive_bookings("2021-01-01") == 1
+    assert Booking.query.count() == 0
+    assert sorted(a.booking_id for a in BookingArchive.query.all()) == [1, 1, last_id]
+
+def test_history_reports_original_booking_ids(app):
+    booking_id = make_booking("2020-01-01")
+    make_booking("2099-01-01")
+    archive_bookings("2021-01-01")
+    archived = [row for row in booking_history() if row.archived]
+    assert [row.id for row in archived] == [booking_id]
@@ -0,0 +1,77 @@
+# tests/test_auth_sessions.py
+# Imports the real app against a throwaway database (DATABASE_URL) and
+# revocation file (AUTH_GENERATION_FILE), not instance/venue_booking.db.
+import importlib, os, time
+import pytest
+
+from auth_sessions import PrincipalCache
+
+@pytest.fixture(scope="module")
+def app_module(tmp_path_factory):
+    tmp = tmp_path_factory.mktemp("auth")
+    os.environ["DATABASE_URL"] = f"sqlite:///{tmp / 'test.db'}"
+    os.environ["AUTH_GENERATION_FILE"] = str(tmp / "auth_generation")
+    try:
+        yield importlib.import_module("app")
+    finally:
+        del os.environ["DATABASE_URL"], os.environ["AUTH_GENERATION_FILE"]
+
+@pytest.fixture
+def faculty(app_module):
+    from models import User
+    with app_module.app.app_context():
+        user = User(username=f"f{time.time_ns()}", password="secret", role="faculty")
+        app_module.db.session.add(user)
+        app_module.db.session.commit()
+        return user.id, user.username
+
+def login(app_module, role, username, password):
+    client = app_module.app.test_client()
+    client.post(f"/login/{role}", data={"username": username, "password": password})
+    return client
+
+def test_generation_bump_clears_other_worker_cache(tmp_path):
+    path = str(tmp_path / "generation")
+    worker_a, worker_b = PrincipalCache(path, ttl=60), PrincipalCache(path, ttl=60)
+    worker_b.put("sid", {"id": 1}, time.time() + 3600)
+    assert worker_b.get("sid") == {"id": 1}
+
+    worker_a.invalidate()
+    assert worker_b.get("sid") is None
+
+def test_cache_entry_never_outlives_session_expiry(tmp_path):
+    cache = PrincipalCache(str(tmp_path / "generation"), ttl=60)
+    cache.put("short", {"id": 1}, time.time() + 0.05)
+    cache.put("long", {"id": 2}, time.time() + 3600)
+    assert cache.get("short") == {"id": 1}
+
+    time.sleep(0.1)
+    assert cache.get("short") is None
+    assert cache.get("long") == {"id": 2}
+    assert "short" not in cache._entries
+
+def test_delete_revokes_session_on_next_request(app_module, faculty):
+    user_id, username = faculty
+    client = login(app_module, "faculty", username, "secret")
+    assert client.get("/faculty").status_code == 200  # Principal now cached
+
+    admin = login(app_module, "admin", "admin", "admin123")
+    admin.post(f"/admin/faculty/delete/{user_id}")
+
+    response = client.get("/faculty")
+    assert response.status_code == 302
+    assert response.headers["Location"].endswith("/login/faculty")
+
+def test_password_reset_revokes_session_on_next_request(app_module, faculty):
+    user_id, username = faculty
+    client = login(app_module, "faculty", username, "secret")
+    assert client.get("/faculty").status_code == 200
+
+    admin = login(app_module, "admin", "admin", "admin123")
+    admin.post(f"/admin/faculty/reset/{user_id}", data={"new_password": "changed"})
+
+    response = client.get("/faculty")
+    assert response.status_code == 302
+    assert response.headers["Location"].endswith("/login/faculty")
+    # Logging in again with the new password works
+    assert login(app_module, "faculty", username, "changed").get("/faculty").status_code == 200
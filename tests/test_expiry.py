@@ -0,0 +1,54 @@
+# tests/test_expiry.py
+import time
+from database import db
+from models import Booking, SchedulerLease, VenueDailyUsage
+from expiry import acquire_lease, expire_pending, renotify_pending
+from rollups import SLOT_BITS, rebuild_usage
+
+HOURS_AGO = int(time.time()) - 100 * 3600
+
+def add_pending(event, slot, date="2031-01-01", when=HOURS_AGO):
+    booking = Booking(event_name=event, faculty_name="faculty", num_people=10, venue="Lab 1",
+                      slot=slot, date=date, status="Pending", created_at=when, notified_at=when)
+    db.session.add(booking)
+    db.session.commit()
+    return booking.id
+
+def test_lease_has_one_owner_until_it_expires(app):
+    assert acquire_lease("job", "worker-a", ttl=60)
+    assert not acquire_lease("job", "worker-b", ttl=60)
+    assert acquire_lease("job", "worker-a", ttl=60)  # Holder renews
+
+    db.session.get(SchedulerLease, "job").expires_at = time.time() - 1
+    db.session.commit()
+    assert acquire_lease("job", "worker-b", ttl=60)
+    assert not acquire_lease("job", "worker-a", ttl=60)
+
+def test_expiry_frees_slot_in_rollup(app):
+    booking_id = add_pending("Seminar", "8:30-9:30")
+    rebuild_usage()
+    usage = db.session.get(VenueDailyUsage, ("Lab 1", "2031-01-01"))
+    assert (usage.pending, usage.pending_mask) == (1, SLOT_BITS["8:30-9:30"])
+
+    assert expire_pending(int(time.time()) - 3600) == 1
+    assert db.session.get(Booking, booking_id).status == "Expired"
+    usage = db.session.get(VenueDailyUsage, ("Lab 1", "2031-01-01"))
+    assert (usage.pending, usage.pending_mask) == (0, 0)
+
+def test_expiry_leaves_recent_bookings_pending(app):
+    booking_id = add_pending("Seminar", "8:30-9:30", when=int(time.time()))
+    assert expire_pending(int(time.time()) - 3600) == 0
+    assert db.session.get(Booking, booking_id).status == "Pending"
+
+def test_one_email_per_group_across_batches(app):
+    for slot in ["8:30-9:30", "9:30-10:30", "10:50-11:50"]:
+        add_pending("Seminar", slot)
+    add_pending("Workshop", "1:30-2:30")
+    sent = []
+
+    # Batch size 2 splits the Seminar group across batches
+    assert renotify_pending(int(time.time()) - 3600, lambda b: sent.append(b.event_name), batch_size=2) == 2
+    assert sorted(sent) == ["Seminar", "Workshop"]
+
+    assert renotify_pending(int(time.time()) - 3600, lambda b: sent.append(b.event_name), batch_size=2) == 0
+    assert len(sent) == 2